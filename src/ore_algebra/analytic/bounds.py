@@ -877,16 +877,33 @@ def growth_parameters(dop):
     # Or maybe a better way to look at this is to say that we are considering
     # the classical Newton polygon at infinity (as in Loday-Richaud 2016,
     # Def. 3.3.10) but we are interested in the inverses of the slopes.
-    points = [(ZZ(j-i), ZZ(i), c) for (i, pol) in enumerate(dop)
-                                  for (j, c) in enumerate(pol)
-                                  if not c.is_zero()]
-    h0, i0, _ = max(points, key=lambda p: (p[1], p[0]))
-    hull = [(h, i, c) for (h, i, c) in points if h > h0 and i < i0]
-    if not hull: # generalized polynomial
+    # The top point (h0, i0) of the polygon comes from the leading coefficient,
+    # and the edge we are looking for is the one of steepest (negative) slope
+    # starting from it. Find it in a single pass over the coefficients, using
+    # machine integers and comparing slopes num/den (den > 0) by
+    # cross-multiplication.
+    i0 = dop.order()
+    lc = dop.leading_coefficient()
+    h0 = lc.degree() - i0
+    num, den = None, 1
+    edge = {}
+    for i, pol in enumerate(dop):
+        for j, c in enumerate(pol):
+            h = j - i
+            if h <= h0 or c.is_zero():
+                continue
+            dh, di = h - h0, i - i0
+            if num is None or di*den > num*dh:
+                num, den = di, dh
+                edge = {i0 - i: c}
+            elif di*den == num*dh:
+                edge[i0 - i] = c
+    if num is None: # generalized polynomial
         return infinity, ZZ.zero()
-    slope = max((i-i0)/(h-h0) for h, i, c in hull)
+    slope = ZZ(num)/den
+    edge[0] = lc.leading_coefficient()
     Pol = dop.base_ring()
-    eqn = Pol({i0 - i: c for (h, i, c) in points if i == i0 + slope*(h-h0)})
+    eqn = Pol(edge)
     expo_growth = abs_min_nonzero_root(eqn)**slope
     return -slope, expo_growth
 
@@ -38,6 +38,13 @@ class Context(object):
           singularities, especially at high precision. It may be slower in
           simple cases, though.
 
+        * ``binsplit_thr`` -- Size of the blocks of terms below which the
+          binary splitting algorithm switches to direct products of the
+          recurrence matrices, and granularity with which it progresses
+          towards the expected truncation order. The default is a reasonable
+          compromise; operators with unusually small or large coefficients
+          may benefit from a different value.
+
         * ``recorder`` -- An object that will be used to record various
           intermediate results for debugging and analysis purposes. At the
           moment recording just consists in writing data to some fields of the
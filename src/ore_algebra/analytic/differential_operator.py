@@ -132,8 +132,8 @@ class PlainDifferentialOperator(UnivariateDifferentialOperatorOverUnivariateRing
     def _est_growth(self):
         # Originally intended for the case of ordinary points only; may need
         # improvements for singular points.
-        from .bounds import growth_parameters, IR, IC
-        kappa, alpha0 = growth_parameters(self)
+        from .bounds import IR, IC
+        kappa, alpha0 = self.growth_parameters()
         if kappa is infinity:
             return kappa, IR.zero()
         # The asymptotic exponential growth may not be such a great estimate
@@ -0,0 +1,36 @@
+# cython: language=c++
+# cython: language_level=3
+r"""
+Evaluation of real ball polynomials at real balls with limited overhead
+"""
+
+from sage.libs.arb.arb cimport *
+
+from sage.rings.polynomial.polynomial_element cimport Polynomial_generic_dense
+from sage.rings.real_arb cimport RealBall
+from sage.structure.parent cimport Parent
+
+def rbf(pol, x):
+    cdef Polynomial_generic_dense _pol = (<Polynomial_generic_dense?> pol)
+    cdef RealBall _x = (<RealBall?> x)
+    cdef RealBall c
+    cdef long i
+
+    # Same parent and working precision as generic evaluation: the coercion
+    # goes from the more precise ball field to the less precise one
+    cdef long pol_prec = _pol._parent._base._prec
+    cdef long prec = _x._parent._prec
+    cdef RealBall res = <RealBall> (RealBall.__new__(RealBall))
+    if pol_prec < prec:
+        prec = pol_prec
+        res._parent = <Parent> _pol._parent._base
+    else:
+        res._parent = _x._parent
+
+    arb_zero(res.value)
+    for i in range(len(_pol.__coeffs) - 1, -1, -1):
+        c = <RealBall?> _pol.__coeffs[i]
+        arb_mul(res.value, res.value, _x.value, prec)
+        arb_add(res.value, res.value, c.value, prec)
+
+    return res
@@ -23,25 +23,27 @@ import sage.plot.all as plot
 
 from sage.misc.cachefunc import cached_method
 from sage.plot.plot import generate_plot_points
-from sage.rings.all import ZZ, QQ, RBF, CBF, RIF, CIF
 from sage.rings.complex_arb import ComplexBall, ComplexBallField
+from sage.rings.cif import CIF
 try:
     from sage.rings.complex_mpfr import ComplexNumber
 except ImportError:
     from sage.rings.complex_number import ComplexNumber
 from sage.rings.infinity import AnInfinity
-from sage.rings.real_arb import RealBall, RealBallField
-from sage.rings.real_mpfi import RealIntervalField
+from sage.rings.integer_ring import ZZ
+from sage.rings.rational_field import QQ
+from sage.rings.real_arb import RBF, RealBall, RealBallField
+from sage.rings.real_mpfi import RIF, RealIntervalField
 from sage.rings.real_mpfr import RealNumber
 
 from . import analytic_continuation as ancont
-from . import bounds
 from . import polynomial_approximation as polapprox
 
+from .accuracy import IR, IC
 from .analytic_continuation import normalize_post_transform
 from .differential_operator import DifferentialOperator
 from .path import Point
-from .safe_cmp import *
+from .safe_cmp import safe_eq, safe_gt
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +54,25 @@ logger = logging.getLogger(__name__)
     #
     # - Introduce separate "Cache" objects?
 
+try:
+    from .eval_poly_at_ball import rbf as _eval_rbf_pol
+except ImportError:
+    _eval_rbf_pol = None
+
+def _eval_pol(pol, x):
+    # The compiled evaluator only handles real ball polynomials at real balls;
+    # complex-valued functions have approximations with complex coefficients
+    if (_eval_rbf_pol is not None and isinstance(x, RealBall)
+            and isinstance(pol.base_ring(), RealBallField)):
+        return _eval_rbf_pol(pol, x)
+    return pol(x)
+
+def _ball_field_like(Balls, prec):
+    if isinstance(Balls, RealBallField):
+        return RealBallField(prec)
+    else:
+        return ComplexBallField(prec)
+
 RealPolApprox = collections.namedtuple('RealPolApprox', ['pol', 'prec'])
 
 class DFiniteFunction(object):
@@ -144,6 +165,11 @@ class DFiniteFunction(object):
             # initial values.
             raise NotImplementedError
         self.ini = ini
+        self._ini_start, self._ini_vec = next(iter(ini.items()))
+        # Rational starting points allow to restart the analytic continuation
+        # from the centers of previously computed disks, see _path_to()
+        self._rat_start = (QQ(self._ini_start) if self._ini_start in QQ
+                           else None)
         self.name = name
 
         # Global maximum width for the approximation intervals. In the case of
@@ -155,12 +181,16 @@ class DFiniteFunction(object):
         # let the user impose a maximum width, even in other cases.
         self.max_rad = RBF(max_rad)
         if dop.leading_coefficient().is_constant():
-            kappa, alpha = bounds.growth_parameters(dop)
+            kappa, alpha = dop.growth_parameters()
             self.max_rad = self.max_rad.min(1/(alpha*RBF(kappa)**kappa))
         self.max_prec = max_prec
 
         self._inivecs = {}
         self._polys = {}
+        self._rounded_polys = {}
+        self._disks = {}
+        self._sings = dop._singularities(IC)
+        self._ball_fields = {}
 
         self._sollya_object = None
         self._sollya_domain = RIF('-inf', 'inf')
@@ -175,7 +205,24 @@ class DFiniteFunction(object):
         return not any(rt.imag().contains_zero()
                 for rt, mult in self.dop.leading_coefficient().roots(CIF))
 
+    def _rbf(self, prec):
+        Balls = self._ball_fields.get(prec)
+        if Balls is None:
+            Balls = self._ball_fields[prec] = RealBallField(prec)
+        return Balls
+
     def _disk(self, pt):
+        key = _disk_key(pt)
+        if key is None:
+            return self._find_disk(pt)
+        disk = self._disks.get(key)
+        if disk is None:
+            if len(self._disks) >= _DISK_CACHE_SIZE:
+                self._disks.clear()
+            disk = self._disks[key] = self._find_disk(pt)
+        return disk
+
+    def _find_disk(self, pt):
         assert pt.is_real()
         # Since approximation disks satisfy 2·rad ≤ dist(center, sing), any
         # approximation disk containing pt must have rad ≤ dist(pt, sing)
@@ -183,35 +230,44 @@ class DFiniteFunction(object):
         # What we want is the largest such disk containing pt
         expo = ZZ(max_rad.log(2).upper().ceil()) - 1 # rad = 2^expo
         logger.log(logging.DEBUG-2, "max_rad = %s, expo = %s", max_rad, expo)
+        # Rational points (the common case) are handled with exact integer
+        # arithmetic, and are always contained in the resulting disk
+        rat = pt.value if pt.value.parent() is QQ else None
         while True:
-            approx_pt = pt.approx_abs_real(-expo)
-            mantissa = (approx_pt.squash() >> expo).floor()
-            if ZZ(mantissa) % 2 == 0:
+            if rat is None:
+                approx_pt = pt.approx_abs_real(-expo)
+                mantissa = ZZ((approx_pt.squash() >> expo).floor())
+            else:
+                approx_pt = rat
+                mantissa = (rat >> expo).floor()
+            if mantissa % 2 == 0:
                 mantissa += 1
-            center = mantissa << expo
-            dist = Point(center, pt.dop).dist_to_sing()
+            # exact center, so that subsequent computations are not limited by
+            # the precision of any parent
+            center = QQ(mantissa) << expo
+            ctr = IC(center)
+            dist = IR('inf').min(*[(ctr - s).abs() for s in self._sings])
             rad = RBF.one() << expo
             logger.log(logging.DEBUG-2,
                     "candidate disk: approx_pt = %s, mantissa = %s, "
                     "center = %s, dist = %s, rad = %s",
                     approx_pt, mantissa, center, dist, rad)
-            if safe_ge(dist >> 1, rad):
+            # both sides are real balls, no need for safe_ge()
+            if dist >> 1 >= rad:
                 break
             expo -= 1
         logger.debug("disk for %s: center=%s, rad=%s", pt, center, rad)
-        # pt may be a ball with nonzero radius: check that it is contained in
-        # our candidate disk
-        log = RBF.zero() if 0 in approx_pt else approx_pt.abs().log(2)
-        F = RealBallField(ZZ((expo - log).max(0).upper().ceil()) + 10)
-        dist_to_center = (F(approx_pt) - F(center)).abs()
-        if not safe_le(dist_to_center, rad):
-            assert not safe_gt((approx_pt.squash() - center).squash(), rad)
-            logger.info("check that |%s - %s| < %s failed",
-                        approx_pt, center, rad)
-            return None, None
-        # exactify center so that subsequent computations are not limited by the
-        # precision of its parent
-        center = QQ(center)
+        if rat is None:
+            # pt may be a ball with nonzero radius: check that it is contained
+            # in our candidate disk
+            log = RBF.zero() if 0 in approx_pt else approx_pt.abs().log(2)
+            F = self._rbf(ZZ((expo - log).max(0).upper().ceil()) + 10)
+            dist_to_center = (F(approx_pt) - F(center)).abs()
+            if not dist_to_center <= rad:
+                assert not safe_gt((approx_pt.squash() - center).squash(), rad)
+                logger.info("check that |%s - %s| < %s failed",
+                            approx_pt, center, rad)
+                return None, None
         return center, rad
 
     def _rad(self, center):
@@ -222,34 +278,58 @@ class DFiniteFunction(object):
         Find a path from a point with known "initial" values to pt
         """
         # TODO:
-        # - attempt to start as close as possible to the destination
-        #   [and perhaps add logic to change for a starting point with exact
-        #   initial values if losing too much precision]
         # - return a path passing through "interesting" points (and cache the
         #   associated initial vectors)
-        start, ini = list(self.ini.items())[0]
-        return ini, [start, Point(dest, self.dop, keep_value=True)]
+        dest = Point(dest, self.dop, keep_value=True)
+        start, ini = self._ini_start, self._ini_vec
+        if (prec is not None and self._rat_start is not None
+                and dest.value.parent() is QQ):
+            # Start from the closest point with sufficiently accurate known
+            # values. Everything then happens on the real line, and the new
+            # path leads to the same branch as the direct one.
+            # XXX: Change for a starting point with exact initial values if
+            # losing too much precision?
+            tol = ZZ(2)**(-prec - 10)
+            dist = abs(dest.value - self._rat_start)
+            for vert, vec in iteritems(self._inivecs):
+                d = abs(dest.value - vert)
+                if 0 < d < dist and all(c.rad() <= tol for c in vec):
+                    start, ini, dist = vert, vec, d
+        return ini, [start, dest]
 
     # Having the update (rather than the full test-and-update) logic in a
     # separate method is convenient to override it in subclasses.
     def _update_approx(self, center, rad, prec, derivatives):
         ini, path = self._path_to(center, prec)
         eps = RBF.one() >> prec
+        # The values at the center computed here both serve as initial values
+        # for doit(), which is then called with a trivial path, and are kept for
+        # later restarts. Restarting is only possible from rational starting
+        # points, in which case we compute them with a margin: _path_to() uses
+        # them as initial values at precision prec only if their radii are at
+        # most 2^(-prec-10), so that, up to the propagation of these errors, the
+        # resulting approximations remain accurate to about 2^(-prec).
+        ini_eps = eps >> (20 if self._rat_start is not None else 1)
         ctx = ancont.Context()
-        sol = ancont.analytic_continuation(self.dop, path, eps, ctx, ini=ini)
+        sol = ancont.analytic_continuation(self.dop, path, ini_eps, ctx,
+                                           ini=ini)
         for point_dict in sol:
             vert, val = point_dict["point"], point_dict["value"]
+            vec = [c[0] for c in val]
+            if vert == center:
+                local_ini = vec
             known = self._inivecs.get(vert)
-            if known is None or known[0].accuracy() < val[0][0].accuracy():
-                self._inivecs[vert] = [c[0] for c in val]
+            if known is None or known[0].accuracy() < vec[0].accuracy():
+                self._inivecs[vert] = vec
         logger.info("computing new polynomial approximations: "
                     "ini=%s, path=%s, rad=%s, eps=%s, ord=%s",
                     ini, path, rad, eps, derivatives)
-        polys = polapprox.doit(self.dop, ini=ini, path=path, rad=rad,
-                eps=eps, derivatives=derivatives, x_is_real=True,
+        polys = polapprox.doit(self.dop, ini=local_ini, path=[center],
+                rad=rad, eps=eps, derivatives=derivatives, x_is_real=True,
                 economization=polapprox.chebyshev_economization)
         logger.info("...done")
         approx = self._polys.get(center, [])
+        # When ini comes from a restart, prec is only nominal (see above)
         new_approx = []
         for ord, pol in enumerate(polys):
             if ord >= len(approx) or approx[ord].prec < prec:
@@ -258,6 +338,20 @@ class DFiniteFunction(object):
                 new_approx.append(approx[ord])
         self._update_approx_hook(center, rad, polys)
         self._polys[center] = new_approx
+        self._rounded_polys.pop(center, None)
+        return polys
+
+    def _rounded_approx(self, center, approx, prec):
+        # Copies of the cached approximations with coefficients rounded to the
+        # target precision, for cheaper low-precision evaluations. They are
+        # dropped by _update_approx() when the approximations at center change.
+        rounded = self._rounded_polys.setdefault(center, {})
+        polys = rounded.get(prec)
+        if polys is None:
+            polys = rounded[prec] = [
+                    a.pol.change_ring(_ball_field_like(a.pol.base_ring(), prec))
+                    if a.prec > prec else a.pol
+                    for a in approx]
         return polys
 
     def _sollya_annotate(self, center, rad, polys):
@@ -337,8 +431,27 @@ class DFiniteFunction(object):
             sage: f.approx(1/3, prec=40, post_transform=Dx^2)
             [-0.540000000000...]
 
+            sage: g = DFiniteFunction(Dx - 1, [CBF(i)])
+            sage: val = g.approx(1/2)
+            sage: val.imag()
+            [1.64872127070...]
+            sage: val.real().contains_zero()
+            True
+
+        Later evaluations restart from the centers of the disks computed so
+        far::
+
+            sage: f = DFiniteFunction((x^2 + 1)*Dx^2 + 2*x*Dx, [0, 1])
+            sage: _ = f.approx(1, prec=30)
+            sage: ini, path = f._path_to(3, 30); path[0]
+            3/2
+            sage: ref = f.dop.numerical_solution([0, 1], [0, 3])
+            sage: f.approx(3, prec=30).overlaps(ref)
+            True
+
         """
-        pt = Point(pt, self.dop)
+        if not (isinstance(pt, Point) and pt.dop is self.dop):
+            pt = Point(pt, self.dop)
         if prec is None:
             prec = _guess_prec(pt)
         if post_transform is None:
@@ -362,16 +475,18 @@ class DFiniteFunction(object):
             return self.dop.numerical_solution(ini, path, eps,
                     post_transform=post_transform)
         approx = self._polys.get(center, [])
-        Balls = RealBallField(prec)
+        Balls = self._rbf(prec)
         # due to the way the polynomials are recomputed, the precisions attached
         # to the successive derivatives are nonincreasing
         if (len(approx) < derivatives or approx[derivatives-1].prec < prec):
             polys = self._update_approx(center, rad, prec, derivatives)
+        elif approx[0].prec > 2*prec:
+            polys = self._rounded_approx(center, approx, prec)
         else:
             polys = [a.pol for a in approx]
         bpt = Balls(pt.value)
         reduced_pt = bpt - Balls(center)
-        val = sum(ZZ(j).factorial()*coeff(bpt)*polys[j](reduced_pt)
+        val = sum(ZZ(j).factorial()*coeff(bpt)*_eval_pol(polys[j], reduced_pt)
                   for j, coeff in enumerate(post_transform))
         return val
 
@@ -397,10 +512,15 @@ class DFiniteFunction(object):
             sage: plot(f, (-10, 5), color='black')
             Graphics object consisting of 1 graphics primitive
         """
-        mids = generate_plot_points(
-                lambda x: self.approx(x, 20).mid(),
-                x_range, plot_points=200)
-        ivs = [(x, self.approx(x, 20)) for x, _ in mids]
+        # Keep the values computed while sampling the function, so that each
+        # plot point is only evaluated once
+        vals = {}
+        def mid(x):
+            y = vals[x] = self.approx(x, 20)
+            return y.mid()
+        mids = generate_plot_points(mid, x_range, plot_points=200)
+        ivs = [(x, vals[x] if x in vals else self.approx(x, 20))
+               for x, _ in mids]
         bounds  = [(x, y.upper()) for x, y in ivs]
         bounds += [(x, y.lower()) for x, y in reversed(ivs)]
         options.setdefault('aspect_ratio', 'automatic')
@@ -496,6 +616,19 @@ class DFiniteFunction(object):
         self._update_approx_hook = self._sollya_annotate
         return self._sollya_object
 
+_DISK_CACHE_SIZE = 1024
+
+def _disk_key(pt):
+    # The disk associated to pt only depends on its value (and on the
+    # function); use it as a cache key when it can be hashed reliably.
+    val = pt.value
+    if isinstance(val, RealBall):
+        return (val.mid(), val.rad())
+    elif val.parent() is QQ:
+        return val
+    else:
+        return None
+
 def _guess_prec(pt):
     if isinstance(pt, (RealNumber, ComplexNumber, RealBall, ComplexBall)):
         return pt.parent().precision()
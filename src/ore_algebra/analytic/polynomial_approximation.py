@@ -28,6 +28,7 @@ logger = logging.getLogger(__name__)
 import sage.rings.real_arb
 import sage.rings.complex_arb
 
+from sage.misc.cachefunc import cached_function
 from sage.rings.rational_field import QQ
 
 from . import accuracy, analytic_continuation as ancont, bounds, utilities
@@ -43,17 +44,28 @@ def combine_radii(pol):
         coeff[i] = coeff[i].squash()
     return pol.parent()(coeff)
 
-def taylor_economization(pol, eps):
+def _scale(pol, rad):
+    r"""
+    Compute ``pol(rad*x)`` by scaling the coefficients of ``pol``.
+    """
+    coef = list(pol)
+    radpow = rad.parent().one()
+    for i in range(1, len(coef)):
+        radpow *= rad
+        coef[i] *= radpow
+    return pol.parent()(coef)
+
+def taylor_economization(pol, eps, rad=None):
     r"""
     Economize a polynomial by removing monomials.
 
     Remove terms from the polynomial ``pol``, starting with the high-order
-    terms, in such a way that its value on the disk `|z| < 1` changes at most
-    by ``eps``.
+    terms, in such a way that its value on the disk `|z| < r` changes at most
+    by ``eps``, where `r` is ``rad`` if specified and 1 otherwise.
 
     A bound on the difference between the result and the input polynomial is
     added to the constant term, so that, for any complex number `z` with
-    `|z| < 1`, the value of the result at `z` contains that of ``pol``.
+    `|z| < r`, the value of the result at `z` contains that of ``pol``.
 
     EXAMPLES::
 
@@ -74,19 +86,31 @@ def taylor_economization(pol, eps):
         sage: Pols.<x> = RBF[]
         sage: taylor_economization(x^5 + 10*x^4 + x^3 + 2*x + 10, RBF(3))
         10.0000...*x^4 + 2.0000...*x + [1e+1 +/- 2.01] + [+/- 2.01]*I
+        sage: taylor_economization(x^5 + 10*x^4 + x^3 + 2*x + 10, RBF(3), RBF(1/2))
+        [1e+1 +/- 1.79] + [+/- 1.79]*I
     """
-    Coefs = pol.base_ring()
+    Pols = pol.parent()
+    Coefs = Pols.base_ring()
     coef = list(pol)
+    # Bounds on the terms of pol on the disk, computed directly from its
+    # coefficients rather than by economizing pol(rad*x)
+    mag = [abs(c) for c in coef]
+    if rad is not None:
+        rad = abs(rad)
+        radpow = rad.parent().one()
+        for i in range(1, len(mag)):
+            radpow *= rad
+            mag[i] *= radpow
     delta_bound = eps.parent().zero()
     zero = Coefs.zero()
-    for i in range(pol.degree(), -1, -1):
-        tmp_bound = delta_bound + abs(pol[i])
+    for i in range(len(coef) - 1, -1, -1):
+        tmp_bound = delta_bound + mag[i]
         if safe_lt(tmp_bound, eps):
             delta_bound = tmp_bound
             coef[i] = zero
-    coef[0] = Coefs.complex_field()(coef[0]).add_error(delta_bound)
-    CPol = pol.parent().change_ring(Coefs.complex_field())
-    return CPol(coef)
+    CCoefs = Coefs.complex_field()
+    coef[0] = CCoefs(coef[0]).add_error(delta_bound)
+    return Pols.change_ring(CCoefs)(coef)
 
 def chebyshev_polynomials(ring, n):
     r"""
@@ -104,15 +128,31 @@ def chebyshev_polynomials(ring, n):
         sage: chebyshev_polynomials(QQ['x'], 0)
         []
     """
-    x = ring.gen()
-    cheb_T = [None]*n
-    if n >= 1:
-        cheb_T[0] = ring.one()
-    if n >= 2:
-        cheb_T[1] = x
-    for k in range(1, n - 1):
-        cheb_T[k+1] = 2*x*cheb_T[k] - cheb_T[k-1]
-    return cheb_T
+    basis = _chebyshev_basis(ring)
+    if len(basis) < n:
+        coeffs = _chebyshev_coefficients(n)
+        basis.extend(ring(list(c)) for c in coeffs[len(basis):])
+    return basis[:n]
+
+# doit() economizes several polynomials with the same parent and similar degrees
+# in a row: keep the longest basis built so far for each ring, so that nearby
+# degrees share it
+@cached_function
+def _chebyshev_basis(ring):
+    return []
+
+# Coefficients of the Chebyshev polynomials computed so far, as tuples of Python
+# ints, by increasing degree
+_cheb_coeffs = [(1,), (0, 1)]
+
+def _chebyshev_coefficients(n):
+    while len(_cheb_coeffs) < n:
+        prev, cur = _cheb_coeffs[-2], _cheb_coeffs[-1]
+        new = [0] + [2*c for c in cur]
+        for k, c in enumerate(prev):
+            new[k] -= c
+        _cheb_coeffs.append(tuple(new))
+    return _cheb_coeffs[:n]
 
 def general_economization(economization_polynomials, pol, eps):
     r"""
@@ -151,25 +191,32 @@ def general_economization(economization_polynomials, pol, eps):
         ....:         x^5 + 10*x^4 + x^3 + 2*x + 10, RBF(3))
         10.00000000000000*x^4 + 2.000000000000000*x + [1e+1 +/- 2.01]
     """
-    ecopol = economization_polynomials(pol.parent(), pol.degree() + 1)
+    Pols = pol.parent()
+    zero = Pols.base_ring().zero()
+    # Work on a list of coefficients updated in place, and only build the
+    # result polynomial at the end
+    coef = list(pol) or [zero]
+    ecopol = economization_polynomials(Pols, len(coef))
     delta_bound = eps.parent().zero()
-    newpol = pol
-    for k in range(pol.degree(), -1, -1):
-        c = newpol[k]/ecopol[k].leading_coefficient()
+    for k in range(len(coef) - 1, -1, -1):
+        c = coef[k]/ecopol[k].leading_coefficient()
         tmp_bound = delta_bound + abs(c)
         if safe_lt(tmp_bound, eps):
             delta_bound = tmp_bound
-            # lc → exact zero
-            high = (newpol >> (k + 1)) << (k + 1)
-            low = newpol[:k]
-            newpol = high + low - c*ecopol[k][:k]
-    newpol = newpol[0].add_error(delta_bound) + ((newpol >> 1) << 1)
-    return newpol
-
-def chebyshev_economization(pol, eps):
+            coef[k] = zero # lc → exact zero
+            # economization polynomials are typically sparse (e.g., Chebyshev
+            # polynomials have every other coefficient zero)
+            for j, e in enumerate(ecopol[k].list()[:k]):
+                if e:
+                    coef[j] -= c*e
+    coef[0] = coef[0].add_error(delta_bound)
+    return Pols(coef)
+
+def chebyshev_economization(pol, eps, rad=None):
     r"""
     Decrease the degree of ``pol`` in such a way that its value on the real
-    segment [-1, 1] changes at most by ``eps``.
+    segment [-r, r] changes at most by ``eps``, where `r` is ``rad`` if
+    specified and 1 otherwise.
 
     EXAMPLES::
 
@@ -184,6 +231,9 @@ def chebyshev_economization(pol, eps):
         sage: from ore_algebra.analytic.polynomial_approximation import _test_fun_approx
         sage: _test_fun_approx(newpol, pol, interval_rad=1)
     """
+    if rad is not None:
+        newpol = chebyshev_economization(_scale(pol, rad), eps)
+        return _scale(newpol, ~rad)
     pol1 = combine_radii(pol)
     return general_economization(chebyshev_polynomials, pol1, eps)
 
@@ -220,7 +270,7 @@ def doit(dop, ini, path, rad, eps, derivatives, economization, x_is_real):
 
     rad = polys[0].base_ring()(rad)
     def postprocess(pol):
-        return economization(pol(rad*x), eps1)(x/rad)
+        return economization(pol, eps1, rad)
     new_polys = polys.apply_map(postprocess)
 
     return new_polys